@@ -1,8 +1,24 @@
+import io
 import os
+import re
+import sys
+import csv
 import json
+import time
+import argparse
 import datetime
 import random
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from moods import MOOD_RESPONSES
 DATA_DIR = "lifesync_data"
+INGEST_CHECKPOINT = os.path.join(DATA_DIR, ".ingest_checkpoint.json")
+INGEST_EXTENSIONS = (".ndjson", ".jsonl", ".csv")
+INGEST_CHUNK_SIZE = 100000  # Records grouped and written per round; also the checkpoint interval
+ROUTINE_FIELDS = ("steps_walked", "sleep_time", "wake_time", "meals", "diet_plan_followed")
+HEALTH_FIELDS = ("past_issues", "current_symptoms")
+# Ingested usernames become directory names under DATA_DIR: no separators, no leading dot
+SAFE_USERNAME_RE = re.compile(r"^[a-z0-9_-][a-z0-9_.-]*$")
 
 class LifeSyncApp:
     def __init__(self, username):
@@ -74,13 +90,7 @@ class LifeSyncApp:
         "Let it out — what’s on your mind?"
     ]
 
-        mood_responses = {
-        "sad": "I'm sorry you're feeling that way. Sometimes journaling helps you reflect and feel lighter.",
-        "anxious": "That’s okay. Take a deep breath. Would you like a grounding tip?",
-        "stress": "Stress can be overwhelming. Try closing your eyes and taking 3 deep breaths.",
-        "happy": "That’s great to hear! What made you happy today?",
-        "motivate": "Remember, progress is progress — even small steps count!"
-    }
+        mood_responses = MOOD_RESPONSES
 
         while True:
             msg = input("You: ").strip().lower()
@@ -88,12 +98,12 @@ class LifeSyncApp:
                 print("Chatbot: I'm always here if you need to talk. 👋")
                 break
 
-        found = False
-        for keyword in mood_responses:
-            if keyword in msg:
-                print("Chatbot:", mood_responses[keyword])
-                found = True
-                break
+            found = False
+            for keyword in mood_responses:
+                if keyword in msg:
+                    print("Chatbot:", mood_responses[keyword])
+                    found = True
+                    break
 
             if not found:
                 print("Chatbot:", random.choice(general_responses))
@@ -107,20 +117,211 @@ class LifeSyncApp:
             print("5. Exit")
             choice = input("Select an option: ")
 
-        if choice == "1":
-            self.write_journal()
-        elif choice == "2":                self.track_routine()
-        elif choice == "3":
-            self.health_and_therapy()
-        elif choice == "4":
-            self.ai_chatbot()
-        elif choice == "5":
-            print("Goodbye! Stay well.")
-            break
-        else:
-            print("Invalid choice.")
+            if choice == "1":
+                self.write_journal()
+            elif choice == "2":
+                self.track_routine()
+            elif choice == "3":
+                self.health_and_therapy()
+            elif choice == "4":
+                self.ai_chatbot()
+            elif choice == "5":
+                print("Goodbye! Stay well.")
+                break
+            else:
+                print("Invalid choice.")
+
+# --- Bulk ingestion (python all4.py ingest <dir-or-file>) ---
+def _write_json_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _load_json(path):
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def _ingest_user(user_records):
+    """Applies all of one user's records with a single read-modify-write per file.
+
+    Writes are idempotent (same keys as the interactive menu, last record wins), so a
+    chunk that is replayed after a crash produces the same files.
+    """
+    username, records = user_records
+    app = LifeSyncApp(username)
+    routines = None
+    history = None
+    journals = {}
+    for record in records:
+        kind = record["type"]
+        date = record["date"]
+        if kind == "routine":
+            if routines is None:
+                routines = _load_json(os.path.join(app.user_dir, "routine.json"))
+            routine = {"date": date}
+            routine.update({k: record[k] for k in ROUTINE_FIELDS if k in record})
+            routines[date] = routine
+        elif kind == "health":
+            if history is None:
+                history = _load_json(os.path.join(app.user_dir, "health.json"))
+            history.update({k: record[k] for k in HEALTH_FIELDS if k in record})
+        elif kind == "journal":
+            journals[date] = record.get("entry", "")
+
+    if routines is not None:
+        _write_json_atomic(os.path.join(app.user_dir, "routine.json"), routines)
+    if history is not None:
+        _write_json_atomic(os.path.join(app.user_dir, "health.json"), history)
+    for date, entry in journals.items():
+        with open(os.path.join(app.user_dir, f"journal_{date}.txt"), "w", encoding="utf-8") as f:
+            f.write(entry)
+    return len(records)
+
+
+def _normalize_record(record):
+    """Returns a cleaned record (known fields only, as strings), or None if it cannot be ingested."""
+    if not isinstance(record, dict):
+        return None
+    user = str(record.get("user") or record.get("username") or "").lower().strip()
+    kind = str(record.get("type") or "").lower().strip()
+    if not SAFE_USERNAME_RE.match(user) or ".." in user:
+        return None
+    if kind not in ("routine", "journal", "health"):
+        return None
+
+    cleaned = {"user": user, "type": kind, "date": None}
+    # Routine and journal records are keyed by date, so a missing date is not defaulted to
+    # today: replaying the same chunk on another day must write the same keys
+    if kind != "health":
+        try:
+            cleaned["date"] = datetime.date.fromisoformat(str(record.get("date") or "")).isoformat()
+        except ValueError:
+            return None
+    fields = {"routine": ROUTINE_FIELDS, "health": HEALTH_FIELDS, "journal": ("entry",)}[kind]
+    for field in fields:
+        value = record.get(field)
+        if value not in (None, ""):
+            cleaned[field] = value if isinstance(value, str) else json.dumps(value)
+    return cleaned
+
+
+def _read_csv_row(f):
+    """Reads one CSV row as bytes, joining physical lines while a quoted field is still open."""
+    row = f.readline()
+    # '"' (0x22) never occurs inside a multi-byte UTF-8 sequence, and an escaped "" counts twice
+    while row and row.count(b'"') % 2:
+        line = f.readline()
+        if not line:
+            break  # Unterminated quote at end of file: left unbalanced, rejected by the parser
+        row += line
+    return row
+
+
+def _read_chunks(path, offset, chunk_size):
+    """Yields (records, end_offset, skipped) chunks from an NDJSON or CSV file, starting at offset.
+
+    CSV rows may span lines inside quoted fields; offsets always fall between whole rows.
+    """
+    is_csv = path.endswith(".csv")
+    with open(path, "rb") as f:
+        header = None
+        if is_csv:
+            header = next(csv.reader([f.readline().decode("utf-8-sig")]), None)
+            if not header:
+                return
+            offset = max(offset, f.tell())
+        f.seek(offset)
+        while True:
+            records = []
+            skipped = 0
+            while len(records) + skipped < chunk_size:
+                line = _read_csv_row(f) if is_csv else f.readline()
+                if not line:
+                    break
+                try:
+                    text = line.decode("utf-8").strip()
+                    if not text:
+                        continue
+                    if is_csv:
+                        if text.count('"') % 2:
+                            raise ValueError("unterminated quoted field")
+                        raw = dict(zip(header, next(csv.reader(io.StringIO(text, newline="")))))
+                    else:
+                        raw = json.loads(text)
+                except (ValueError, csv.Error, StopIteration):  # UnicodeDecodeError is a ValueError
+                    raw = None
+                record = _normalize_record(raw)
+                if record is None:
+                    skipped += 1
+                else:
+                    records.append(record)
+            if not records and not skipped:
+                return
+            yield records, f.tell(), skipped
+
+
+def _ingest_sources(path):
+    if os.path.isdir(path):
+        return [os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.endswith(INGEST_EXTENSIONS)]
+    return [path]
+
+
+def ingest(path, workers=None, chunk_size=INGEST_CHUNK_SIZE):
+    """Bulk-imports routine, journal and health records for many users.
+
+    Records are grouped by user per chunk and users are written in parallel. Progress is
+    checkpointed per source file after each chunk, so an interrupted import resumes where
+    it stopped when run again.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+    checkpoint = _load_json(INGEST_CHECKPOINT)
+    total = skipped_total = 0
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for source in _ingest_sources(path):
+            key = os.path.abspath(source)
+            state = checkpoint.get(key, {})
+            size = os.path.getsize(source)
+            offset = state.get("offset", 0) if state.get("size", size) <= size else 0
+            if offset >= size and state:
+                print(f"{source}: already ingested, skipping.")
+                continue
+
+            for records, end_offset, skipped in _read_chunks(source, offset, chunk_size):
+                by_user = defaultdict(list)
+                for record in records:
+                    by_user[record["user"]].append(record)
+                total += sum(pool.map(_ingest_user, by_user.items()))
+                skipped_total += skipped
+
+                checkpoint[key] = {"offset": end_offset, "size": size}
+                _write_json_atomic(INGEST_CHECKPOINT, checkpoint)
+                elapsed = time.perf_counter() - started
+                print(f"{source}: {total} records ({total / elapsed:,.0f} records/s), {skipped_total} skipped")
+
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed else 0.0
+    print(f"Ingested {total} records in {elapsed:.2f}s ({rate:,.0f} records/s), {skipped_total} skipped.")
+    return total
+
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "ingest":
+        parser = argparse.ArgumentParser(prog="all4.py ingest", description="Bulk-import NDJSON/CSV records.")
+        parser.add_argument("path", help="NDJSON/CSV file, or a directory of them")
+        parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+        parser.add_argument("--chunk-size", type=int, default=INGEST_CHUNK_SIZE, help="records per checkpoint")
+        args = parser.parse_args(sys.argv[2:])
+        ingest(args.path, workers=args.workers, chunk_size=args.chunk_size)
+        sys.exit(0)
+
     print("Welcome to LifeSync")
     user = input("Enter your username: ")
     app = LifeSyncApp(user)
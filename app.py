@@ -1,6 +1,10 @@
 # app.py
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, date
 import calendar  # For month names
 
@@ -15,6 +19,8 @@ from dailytracker import (
     get_or_create_routine,
 )
 from attractions import attractions_manager  # Use the global instance
+from journal_analytics import journal_analytics  # Use the global instance
+from reminders import ReminderIndex, ReminderScheduler, LogReminderSink
 
 app = Flask(__name__)
 app.secret_key = os.urandom(24)  # Needed for flashing messages
@@ -72,6 +78,22 @@ def journal_page():
 all_routines_data = (
     load_routines()
 )  # Load once at app start, or move inside route if frequent updates from elsewhere
+# Follows add/toggle/delete on the routines, so it never has to rescan them
+reminder_index = ReminderIndex()
+reminder_index.watch(all_routines_data)
+reminder_scheduler = ReminderScheduler(reminder_index, LogReminderSink(app.logger))
+_reminder_scheduler_lock = threading.Lock()
+REMINDER_WINDOW_MAX_MINUTES = 7 * 24 * 60
+
+
+@app.before_request
+def start_reminder_scheduler():
+    # Started by the first request, so it runs however the app is served (and only in the
+    # process that serves requests, not the debug reloader's watcher process)
+    if reminder_scheduler.running:  # Lock-free fast path for every request after the first
+        return
+    with _reminder_scheduler_lock:
+        reminder_scheduler.start()
 
 
 @app.route("/routine", methods=["GET"])
@@ -81,6 +103,7 @@ def routine_page():
     current_routine = get_or_create_routine(selected_date_obj, all_routines_data)
 
     monthly_report_data = None
+    mood_trend_data = None
     if request.args.get("view_report"):
         try:
             report_month = int(request.args.get("report_month", date.today().month))
@@ -90,6 +113,10 @@ def routine_page():
                     report_year, report_month, all_routines_data
                 )
                 monthly_report_data = report_generator.get_report_data()
+                journal_analytics.refresh()  # Only re-reads new or changed days
+                mood_trend_data = journal_analytics.get_monthly_mood_trend(
+                    report_year, report_month
+                )
             else:
                 flash("Invalid month selected for report.", "warning")
         except ValueError:
@@ -101,6 +128,7 @@ def routine_page():
         selected_date_iso=selected_date_obj.isoformat(),
         selected_date_str=selected_date_obj.strftime("%A, %B %d, %Y"),
         monthly_report_data=monthly_report_data,
+        mood_trend_data=mood_trend_data,
         current_month=date.today().month,
         current_year=date.today().year,
         month_names={i: calendar.month_name[i] for i in range(1, 13)},
@@ -158,12 +186,8 @@ def toggle_routine_item():
 
         completed = True if status_str == "complete" else False
 
-        item_found = False
-        for item in routine.items:
-            if item.task == task_name:
-                item.completed = completed
-                item_found = True
-                break
+        # Goes through DailyRoutine so the completion rollups stay up to date
+        item_found = routine.mark_item_complete(task_name, completed)
 
         if item_found:
             save_routines(all_routines_data)
@@ -199,12 +223,7 @@ def delete_routine_item():
         routine_date_obj = date.fromisoformat(routine_date_str)
         if routine_date_str in all_routines_data:
             routine = all_routines_data[routine_date_str]
-            initial_item_count = len(routine.items)
-            routine.items = [
-                item for item in routine.items if item.task != task_name_to_delete
-            ]
-
-            if len(routine.items) < initial_item_count:
+            if routine.remove_item(task_name_to_delete):
                 save_routines(all_routines_data)
                 flash(f"Task '{task_name_to_delete}' deleted.", "success")
             else:
@@ -218,6 +237,143 @@ def delete_routine_item():
     return redirect(url_for("routine_page", date=routine_date_str))
 
 
+# --- Dashboard API ---
+DASHBOARD_RECENT_JOURNAL_DAYS = 3
+DASHBOARD_NEARBY_LIMIT = 3
+DASHBOARD_SECTION_TIMEOUTS = {  # Seconds, for the sections that do I/O on the shared pool
+    "journal": 2.0,
+    "attractions": 2.0,
+}
+# Shared across requests. A timed-out section keeps its worker, so each section is capped at
+# DASHBOARD_SLOTS_PER_SECTION in-flight calls and the pool has a worker for every slot: a
+# submitted section always starts at once (its timeout never includes queueing), and a section
+# stuck on a slow disk reports "busy" instead of starving the others.
+DASHBOARD_SLOTS_PER_SECTION = 8
+dashboard_executor = ThreadPoolExecutor(
+    max_workers=DASHBOARD_SLOTS_PER_SECTION * len(DASHBOARD_SECTION_TIMEOUTS),
+    thread_name_prefix="dashboard",
+)
+dashboard_slots = {
+    name: threading.BoundedSemaphore(DASHBOARD_SLOTS_PER_SECTION)
+    for name in DASHBOARD_SECTION_TIMEOUTS
+}
+
+
+def _dashboard_routine():
+    # Read-only lookup: the dashboard shouldn't insert empty routines into the shared store
+    today = date.today()
+    routine = all_routines_data.get(today.isoformat())
+    items = [item.to_dict() for item in routine.items] if routine else []
+    return {
+        "date": today.isoformat(),
+        "items": items,
+        "completion": routine.get_completion_percentage() if routine else 0.0,
+    }
+
+
+def _dashboard_streak():
+    return {"current_streak": all_routines_data.rollups.get_current_streak()}
+
+
+def _dashboard_journal():
+    return {"entries": read_journal_entries(limit=DASHBOARD_RECENT_JOURNAL_DAYS)}
+
+
+def _dashboard_attractions(latitude, longitude):
+    if latitude is None or longitude is None:
+        attractions = [
+            (att, None)
+            for att in attractions_manager.get_all_attractions()[:DASHBOARD_NEARBY_LIMIT]
+        ]
+    else:
+        attractions = attractions_manager.get_nearby_attractions(
+            latitude, longitude, DASHBOARD_NEARBY_LIMIT
+        )
+    return {
+        "attractions": [
+            dict(att.get_details(), distance_km=round(km, 2) if km is not None else None)
+            for att, km in attractions
+        ]
+    }
+
+
+def _timed(section_fn, *args):
+    started = time.perf_counter()
+    data = section_fn(*args)
+    return data, (time.perf_counter() - started) * 1000
+
+
+def _submit_section(name, section_fn, *args):
+    """Runs a section on the shared pool; returns None when all of its slots are taken."""
+    slots = dashboard_slots[name]
+    if not slots.acquire(blocking=False):
+        return None
+    future = dashboard_executor.submit(_timed, section_fn, *args)
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+def _section_result(name, result_fn):
+    try:
+        data, elapsed_ms = result_fn()
+        return {"status": "ok", "data": data, "elapsed_ms": round(elapsed_ms, 2)}
+    except FutureTimeoutError:
+        # The worker keeps running (and holding its slot); its result is simply dropped
+        return {"status": "timeout", "data": None, "elapsed_ms": None}
+    except Exception as e:
+        app.logger.exception("Dashboard section %s failed", name)
+        return {"status": "error", "error": str(e), "data": None, "elapsed_ms": None}
+
+
+@app.route("/api/dashboard")
+def dashboard_api():
+    """Today's routine, streak, recent journal entries and nearby spots in one response.
+
+    The journal and attractions sections are gathered concurrently on a shared pool; the
+    in-memory routine and streak sections run inline. A section that fails, times out or
+    finds the pool busy is reported with its status and the rest is still returned.
+    """
+    latitude = request.args.get("lat", type=float)
+    longitude = request.args.get("lon", type=float)
+    started = time.perf_counter()
+    futures = {
+        "journal": _submit_section("journal", _dashboard_journal),
+        "attractions": _submit_section(
+            "attractions", _dashboard_attractions, latitude, longitude
+        ),
+    }
+
+    sections = {
+        "routine": _section_result("routine", lambda: _timed(_dashboard_routine)),
+        "streak": _section_result("streak", lambda: _timed(_dashboard_streak)),
+    }
+    for name, future in futures.items():
+        if future is None:
+            sections[name] = {"status": "busy", "data": None, "elapsed_ms": None}
+            continue
+        remaining = DASHBOARD_SECTION_TIMEOUTS[name] - (time.perf_counter() - started)
+        sections[name] = _section_result(
+            name, lambda: future.result(timeout=max(remaining, 0))
+        )
+
+    return jsonify(
+        {
+            "sections": sections,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+    )
+
+
+# --- Reminders ---
+@app.route("/api/reminders")
+def reminders_api():
+    """Routine items due in the next `minutes` (default 60, at most a week)."""
+    minutes = request.args.get("minutes", 60, type=int)
+    minutes = max(0, min(minutes, REMINDER_WINDOW_MAX_MINUTES))
+    due = reminder_index.due_within(minutes)
+    return jsonify({"minutes": minutes, "reminders": [r.to_dict() for r in due]})
+
+
 # --- Health and Therapy Spots Feature ---
 @app.route("/health_therapy")
 def health_page():
@@ -1,4 +1,5 @@
 # attractions_logic.py
+import math
 
 class Attraction:
     """Represents a local attraction."""
@@ -56,6 +57,20 @@ class LocalAttractionsManager:
         category_lower = category.lower()
         return [attraction for attraction in self.attractions if attraction.category.lower() == category_lower]
 
+    def get_nearby_attractions(self, latitude, longitude, limit=5):
+        """Returns up to `limit` (attraction, distance_km) pairs, closest first."""
+        def distance_km(attraction):
+            # Haversine distance on a spherical Earth
+            lat1, lon1 = math.radians(latitude), math.radians(longitude)
+            lat2, lon2 = math.radians(attraction.latitude), math.radians(attraction.longitude)
+            a = (math.sin((lat2 - lat1) / 2) ** 2
+                 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+            return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+        with_distance = [(attraction, distance_km(attraction)) for attraction in self.attractions]
+        with_distance.sort(key=lambda pair: pair[1])
+        return with_distance[:limit]
+
     def get_categories(self):
         """Returns a list of unique attraction categories."""
         return sorted(list(set(att.category for att in self.attractions)))
@@ -3,9 +3,11 @@ import datetime
 import calendar
 from collections import defaultdict
 import json
+import math
 import os
 
 ROUTINES_FILE = "routines_data.json"
+ROLLUPS_KEY = "_rollups" # Stored alongside the {date_iso_str: routine_dict} entries
 
 class RoutineItem:
     """Represents a single routine item."""
@@ -49,19 +51,38 @@ class DailyRoutine:
                 raise TypeError("Date must be a datetime.date object or valid ISO format string.")
         self.date = date
         self.items = []
+        # Notified of item changes (see RoutineRollups); shared with the owning RoutineStore
+        self._listeners = []
+
+    def _notify(self, event, *args):
+        for listener in self._listeners:
+            getattr(listener, event)(self, *args)
 
     def add_item(self, item):
         if not isinstance(item, RoutineItem):
             raise TypeError("Item must be a RoutineItem object.")
         self.items.append(item)
+        self._notify("item_added", item)
 
     def mark_item_complete(self, task_name, completed_status=True):
         for item in self.items:
             if item.task == task_name:
-                item.completed = completed_status
+                if item.completed != completed_status:
+                    item.completed = completed_status
+                    self._notify("item_toggled", item)
                 return True
         return False # Item not found
 
+    def remove_item(self, task_name):
+        """Removes every item with the given task name. Returns True if any were removed."""
+        removed = [item for item in self.items if item.task == task_name]
+        if not removed:
+            return False
+        self.items = [item for item in self.items if item.task != task_name]
+        for item in removed:
+            self._notify("item_removed", item)
+        return True
+
     def get_completion_percentage(self):
         if not self.items:
             return 0.0 # Changed to 0.0 for no items, 100% felt misleading
@@ -89,6 +110,229 @@ class DailyRoutine:
         return routine
 
 
+class RoutineRollups:
+    """Completion statistics kept up to date as routines change, instead of re-walking every day.
+
+    Listens to DailyRoutine changes (add/toggle/remove item) through a RoutineStore.
+    """
+    def __init__(self):
+        self.days = {}    # {date_iso_str: [completed, total]}
+        self.months = {}  # {"YYYY-MM": aggregate}
+        self.years = {}   # {"YYYY": aggregate}
+        self.tasks = {}   # {task: {"scheduled": n, "completed": n}}
+
+    @staticmethod
+    def _empty_aggregate():
+        return {"recorded_days": 0, "completion_sum": 0.0, "fully_completed_days": 0,
+                "completed_items": 0, "total_items": 0}
+
+    @staticmethod
+    def _add_day_to(aggregate, completed, total, sign):
+        aggregate["recorded_days"] += sign
+        aggregate["completion_sum"] += sign * ((completed / total) * 100 if total else 0.0)
+        aggregate["fully_completed_days"] += sign * (1 if total and completed == total else 0)
+        aggregate["completed_items"] += sign * completed
+        aggregate["total_items"] += sign * total
+
+    def _apply_day(self, date_str, counts):
+        """Replaces a day's [completed, total] (None removes it) and updates the aggregates."""
+        buckets = [self.months.setdefault(date_str[:7], self._empty_aggregate()),
+                   self.years.setdefault(date_str[:4], self._empty_aggregate())]
+        old = self.days.get(date_str)
+        for aggregate in buckets:
+            if old is not None:
+                self._add_day_to(aggregate, old[0], old[1], -1)
+            if counts is not None:
+                self._add_day_to(aggregate, counts[0], counts[1], 1)
+        if counts is None:
+            self.days.pop(date_str, None)
+        else:
+            self.days[date_str] = list(counts)
+
+    def _count_task(self, item, sign):
+        counters = self.tasks.setdefault(item.task, {"scheduled": 0, "completed": 0})
+        counters["scheduled"] += sign
+        counters["completed"] += sign * int(item.completed)
+        if not counters["scheduled"]:
+            del self.tasks[item.task]
+
+    def _day_counts(self, routine):
+        return self.days.get(routine.date.isoformat(), [0, 0])
+
+    # --- Listener interface ---
+    def routine_added(self, routine):
+        completed = sum(item.completed for item in routine.items)
+        self._apply_day(routine.date.isoformat(), (completed, len(routine.items)))
+        for item in routine.items:
+            self._count_task(item, 1)
+
+    def routine_removed(self, routine):
+        self._apply_day(routine.date.isoformat(), None)
+        for item in routine.items:
+            self._count_task(item, -1)
+
+    def item_added(self, routine, item):
+        completed, total = self._day_counts(routine)
+        self._apply_day(routine.date.isoformat(), (completed + int(item.completed), total + 1))
+        self._count_task(item, 1)
+
+    def item_removed(self, routine, item):
+        completed, total = self._day_counts(routine)
+        self._apply_day(routine.date.isoformat(), (completed - int(item.completed), total - 1))
+        self._count_task(item, -1)
+
+    def item_toggled(self, routine, item):
+        delta = 1 if item.completed else -1
+        completed, total = self._day_counts(routine)
+        self._apply_day(routine.date.isoformat(), (completed + delta, total))
+        self.tasks[item.task]["completed"] += delta
+
+    # --- Queries ---
+    def get_month(self, year, month):
+        return self.months.get(f"{year:04d}-{month:02d}", self._empty_aggregate())
+
+    def get_year(self, year):
+        return self.years.get(f"{year:04d}", self._empty_aggregate())
+
+    def is_fully_completed(self, date_obj):
+        counts = self.days.get(date_obj.isoformat())
+        return bool(counts and counts[1] and counts[0] == counts[1])
+
+    def get_current_streak(self, as_of=None):
+        """Consecutive 100%-completed days ending at as_of (default today).
+
+        An unfinished as_of day does not break the streak, since that day is still in progress.
+        """
+        day = as_of or datetime.date.today()
+        if not self.is_fully_completed(day):
+            day -= datetime.timedelta(days=1)
+        streak = 0
+        while self.is_fully_completed(day):
+            streak += 1
+            day -= datetime.timedelta(days=1)
+        return streak
+
+    # --- Persistence ---
+    def to_dict(self):
+        return {"days": self.days, "months": self.months, "years": self.years, "tasks": self.tasks}
+
+    @classmethod
+    def from_dict(cls, data):
+        rollups = cls()
+        rollups.days = {d: list(counts) for d, counts in data["days"].items()}
+        rollups.months = data["months"]
+        rollups.years = data["years"]
+        rollups.tasks = data["tasks"]
+        return rollups
+
+    @classmethod
+    def build(cls, routines):
+        """Builds rollups from scratch out of an iterable of DailyRoutine objects."""
+        rollups = cls()
+        for routine in routines:
+            rollups.routine_added(routine)
+        return rollups
+
+
+class RoutineStore(dict):
+    """{date_iso_str: DailyRoutine} that notifies its listeners (rollups first) of every change.
+
+    Every dict mutator (item assignment/deletion, pop, popitem, update, |=, setdefault, clear)
+    notifies the listeners; items must be changed through DailyRoutine.add_item/
+    mark_item_complete/remove_item.
+    """
+    def __init__(self, routines=None, rollups=None):
+        super().__init__()
+        self._listeners = []
+        for date_str, routine in (routines or {}).items():
+            routine._listeners = self._listeners
+            super().__setitem__(date_str, routine)
+        self.rollups = rollups if rollups is not None else RoutineRollups.build(self.values())
+        self._listeners.append(self.rollups)
+
+    def add_listener(self, listener):
+        """Registers another listener. It is not replayed existing routines."""
+        self._listeners.append(listener)
+
+    def __setitem__(self, date_str, routine):
+        if date_str in self:
+            del self[date_str]
+        routine._listeners = self._listeners
+        super().__setitem__(date_str, routine)
+        for listener in self._listeners:
+            listener.routine_added(routine)
+
+    def __delitem__(self, date_str):
+        routine = self[date_str]
+        super().__delitem__(date_str)
+        routine._listeners = []
+        for listener in self._listeners:
+            listener.routine_removed(routine)
+
+    def pop(self, date_str, *default):
+        if date_str not in self:
+            if default:
+                return default[0]
+            raise KeyError(date_str)
+        routine = self[date_str]
+        del self[date_str]
+        return routine
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): routine store is empty")
+        date_str = next(reversed(self))  # LIFO, like dict.popitem
+        return date_str, self.pop(date_str)
+
+    def update(self, *args, **kwargs):
+        for date_str, routine in dict(*args, **kwargs).items():
+            self[date_str] = routine
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, date_str, routine):
+        if date_str not in self:
+            self[date_str] = routine
+        return self[date_str]
+
+    def clear(self):
+        for date_str in list(self):
+            del self[date_str]
+
+
+def check_rollups(routines_dict):
+    """Rebuilds rollups from the raw routines and diffs them against the maintained ones.
+
+    Returns a list of human-readable differences; an empty list means they are consistent.
+    """
+    expected = RoutineRollups.build(routines_dict.values()).to_dict()
+    actual = routines_dict.rollups.to_dict()
+    differences = []
+    for section in ("days", "months", "years", "tasks"):
+        for key in sorted(set(expected[section]) | set(actual[section])):
+            want = expected[section].get(key)
+            got = actual[section].get(key)
+            if want is None or got is None:
+                leftover_bucket = section in ("months", "years") and _is_empty(want or got)
+                if not leftover_bucket:
+                    differences.append(f"{section}[{key}]: expected {want}, found {got}")
+                continue
+            if isinstance(want, dict):
+                for field in want:
+                    if not math.isclose(want[field], got.get(field, 0), abs_tol=1e-6):
+                        differences.append(f"{section}[{key}].{field}: expected {want[field]}, found {got.get(field)}")
+            elif want != got:
+                differences.append(f"{section}[{key}]: expected {want}, found {got}")
+    return differences
+
+
+def _is_empty(aggregate):
+    # Month/year buckets can be left at zero after their last day is removed
+    return all(math.isclose(value, 0, abs_tol=1e-6) for value in aggregate.values())
+
+
 class MonthlyReport:
     """Generates a monthly report of daily routines."""
     def __init__(self, year, month, routines_dict): # routines_dict is {date_iso_str: DailyRoutine_obj}
@@ -100,16 +344,32 @@ class MonthlyReport:
             raise TypeError("Routines must be a dictionary.")
         self.year = year
         self.month = month
-        # Filter routines for the given month and year
-        self.routines_for_month = {}
-        for date_str, routine_obj in routines_dict.items():
-            date_obj = datetime.date.fromisoformat(date_str)
-            if date_obj.year == year and date_obj.month == month:
-                self.routines_for_month[date_obj] = routine_obj
-        
+        self.routines_dict = routines_dict
+        # Summary questions are answered from the rollups when the routines come from a RoutineStore
+        self.rollups = getattr(routines_dict, "rollups", None)
+        self._routines_for_month = None
         self.days_in_month = calendar.monthrange(year, month)[1]
 
+    @property
+    def routines_for_month(self):
+        """Routines for the given month and year, filtered on first use."""
+        if self._routines_for_month is None:
+            self._routines_for_month = {}
+            for date_str, routine_obj in self.routines_dict.items():
+                date_obj = datetime.date.fromisoformat(date_str)
+                if date_obj.year == self.year and date_obj.month == self.month:
+                    self._routines_for_month[date_obj] = routine_obj
+        return self._routines_for_month
+
+    def get_recorded_days(self):
+        if self.rollups is not None:
+            return self.rollups.get_month(self.year, self.month)["recorded_days"]
+        return len(self.routines_for_month)
+
     def get_average_completion(self):
+        if self.rollups is not None:
+            aggregate = self.rollups.get_month(self.year, self.month)
+            return aggregate["completion_sum"] / aggregate["recorded_days"] if aggregate["recorded_days"] else 0.0
         total_completion = 0
         valid_days = 0
         for day in range(1, self.days_in_month + 1):
@@ -120,6 +380,8 @@ class MonthlyReport:
         return total_completion / valid_days if valid_days > 0 else 0.0
 
     def get_completed_days(self):
+        if self.rollups is not None:
+            return self.rollups.get_month(self.year, self.month)["fully_completed_days"]
         completed_days = 0
         for day in range(1, self.days_in_month + 1):
             date = datetime.date(self.year, self.month, day)
@@ -153,7 +415,7 @@ class MonthlyReport:
         return {
             "month_year": f"{calendar.month_name[self.month]} {self.year}",
             "average_completion": f"{self.get_average_completion():.2f}%",
-            "fully_completed_days": f"{self.get_completed_days()} / {len(self.routines_for_month)} (recorded days)", # Changed to recorded days
+            "fully_completed_days": f"{self.get_completed_days()} / {self.get_recorded_days()} (recorded days)", # Changed to recorded days
             "total_days_in_month": self.days_in_month,
             "daily_details": daily_details,
             "analysis": analysis,
@@ -166,7 +428,7 @@ class MonthlyReport:
         average_completion = self.get_average_completion()
         completed_days = self.get_completed_days()
 
-        if not self.routines_for_month: # No data for the month
+        if not self.get_recorded_days(): # No data for the month
             analysis_pts.append("No routine data recorded for this month.")
             recommendations_pts.append("Start tracking your daily routines to gain insights.")
             return analysis_pts, recommendations_pts
@@ -201,12 +463,13 @@ class MonthlyReport:
 
 # --- Persistence Functions ---
 def load_routines():
-    """Loads routines from JSON file."""
+    """Loads routines (and their persisted rollups) from JSON file into a RoutineStore."""
     if not os.path.exists(ROUTINES_FILE):
-        return {} # Return empty dict if file doesn't exist
+        return RoutineStore() # Return empty store if file doesn't exist
     try:
         with open(ROUTINES_FILE, 'r') as f:
             data = json.load(f)
+        rollups_data = data.pop(ROLLUPS_KEY, None)
         routines = {}
         for date_str, routine_data_list in data.items(): # Expecting {date_str: [item_dicts]}
             # This needs to be fixed. Should be {date_str: routine_dict}
@@ -216,15 +479,35 @@ def load_routines():
                  routines[date_str] = DailyRoutine.from_dict(routine_data_list)
             else: # Try to adapt from an older format if necessary, or log an error
                 print(f"Warning: Skipping malformed routine data for date {date_str}")
-        return routines
+        rollups = None
+        if rollups_data is not None:
+            try:
+                rollups = RoutineRollups.from_dict(rollups_data)
+            except (KeyError, TypeError, AttributeError):
+                print("Warning: Malformed routine rollups, rebuilding them.")
+        store = RoutineStore(routines, rollups)
+        if rollups is not None:
+            # The routines were edited outside the app (or the rollups are stale): trust the raw data.
+            # Costs about as much as the parse above, and covers every aggregate, not just the days.
+            try:
+                stale = bool(check_rollups(store))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                stale = True
+            if stale:
+                print("Warning: Routine rollups don't match the routine data, rebuilding them.")
+                store = RoutineStore(routines)
+        return store
     except (json.JSONDecodeError, IOError, TypeError) as e:
         print(f"Error loading routines: {e}. Starting with an empty routine set.")
-        return {}
+        return RoutineStore()
 
 
 def save_routines(routines_dict): # routines_dict is {date_iso_str: DailyRoutine_obj}
-    """Saves routines to JSON file."""
+    """Saves routines (and their rollups, for a RoutineStore) to JSON file."""
     serializable_routines = {date_str: routine.to_dict() for date_str, routine in routines_dict.items()}
+    rollups = getattr(routines_dict, "rollups", None)
+    if rollups is not None:
+        serializable_routines[ROLLUPS_KEY] = rollups.to_dict()
     with open(ROUTINES_FILE, 'w') as f:
         json.dump(serializable_routines, f, indent=4)
 
@@ -255,6 +538,8 @@ if __name__ == "__main__":
 
     # Save changes
     save_routines(all_routines)
+    print("Streak:", all_routines.rollups.get_current_streak(), "day(s)")
+    print("Rollup differences:", check_rollups(all_routines) or "none")
 
     # Generate a report for the current month
     report_generator = MonthlyReport(today.year, today.month, all_routines)
@@ -20,14 +20,16 @@ def write_journal_entry(entry_text):
         f.write(entry_text + "\n\n")
     return True, "Journal entry saved privately."
 
-def read_journal_entries():
-    """Reads all journal entries, sorted by filename (date)."""
+def read_journal_entries(limit=None):
+    """Reads journal entries, newest first; only the most recent `limit` days if given."""
     entries_data = []
     if not os.path.exists(JOURNAL_DIR):
         return entries_data
         
     files = sorted(os.listdir(JOURNAL_DIR), reverse=True) # Show newest first
     for filename in files:
+        if limit is not None and len(entries_data) >= limit:
+            break
         if filename.endswith(".txt"):
             date_str = filename.replace('.txt','')
             try:
@@ -0,0 +1,217 @@
+# journal_analytics.py
+import calendar
+import json
+import os
+import re
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from moods import MOOD_INFLECTIONS
+from journal import JOURNAL_DIR
+
+ANALYTICS_CACHE_FILE = "journal_analytics_cache.json"
+CACHE_VERSION = 3  # Bump when the cached analysis format changes
+
+# Moods known to the chatbot, split by tone for scoring
+POSITIVE_MOODS = ("happy", "motivate")
+NEGATIVE_MOODS = ("sad", "anxious", "stress")
+# word form -> mood keyword ('stressed' -> 'stress')
+MOOD_OF_WORD = {word: mood for mood, words in MOOD_INFLECTIONS.items() for word in words}
+
+TOP_KEYWORDS = 10
+STOPWORDS = frozenset("""
+a about after all am an and any are as at be been but by can could did do
+does for from had has have he her him his how i if in into is it its just
+me my no not of on or our out she so some than that the their them then
+there they this to too up us was we were what when which who will with
+would you your
+i'm i've i'll i'd you're you've it's that's there's don't doesn't didn't
+can't couldn't won't wouldn't isn't wasn't aren't weren't haven't hasn't
+let's
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+_TIMESTAMP_RE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})$", re.MULTILINE)
+
+
+def split_entries(text):
+    """Splits a day file into (timestamp, body) pairs as written by write_journal_entry."""
+    parts = _TIMESTAMP_RE.split(text)
+    if len(parts) == 1:
+        return [(None, text.strip())] if text.strip() else []
+    entries = []
+    if parts[0].strip():  # Text before the first timestamp
+        entries.append((None, parts[0].strip()))
+    for i in range(1, len(parts), 2):
+        entries.append((parts[i], parts[i + 1].strip()))
+    return entries
+
+
+def score_text(text):
+    """Returns mood counts, a mood score in [-1, 1] and keyword counts for a piece of text."""
+    # Count every token once in C (Counter), then only classify the distinct terms
+    term_counts = Counter(_TOKEN_RE.findall(text.lower()))
+    moods = Counter()
+    keywords = Counter()
+    for term, count in term_counts.items():
+        mood = MOOD_OF_WORD.get(term)
+        if mood:
+            moods[mood] += count
+        if len(term) > 2 and term not in STOPWORDS:
+            keywords[term] = count
+
+    positive = sum(moods[m] for m in POSITIVE_MOODS)
+    negative = sum(moods[m] for m in NEGATIVE_MOODS)
+    mood_score = (positive - negative) / (positive + negative) if positive + negative else 0.0
+    return {
+        "moods": dict(moods),
+        "mood_score": round(mood_score, 4),
+        "keywords": dict(keywords),
+        "word_count": sum(term_counts.values()),
+    }
+
+
+def analyze_day_file(path):
+    """Scores each entry of a single journal day file and the day as a whole."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    entries = []
+    day_moods = Counter()
+    day_keywords = Counter()
+    for timestamp, body in split_entries(text):
+        scores = score_text(body)
+        # Keywords are only kept per day, to keep the rewritten-on-change cache small
+        entries.append({
+            "timestamp": timestamp,
+            "moods": scores["moods"],
+            "mood_score": scores["mood_score"],
+            "word_count": scores["word_count"],
+        })
+        day_moods.update(scores["moods"])
+        day_keywords.update(scores["keywords"])
+    scored = [e["mood_score"] for e in entries if e["moods"]]
+    return {
+        "entries": entries,
+        "moods": dict(day_moods),
+        "mood_score": round(sum(scored) / len(scored), 4) if scored else 0.0,
+        # Full counts, so monthly top keywords aren't built from per-day top lists
+        "keywords": dict(day_keywords),
+    }
+
+
+class JournalAnalytics:
+    """Mood and keyword analytics over the journal, cached per day file by mtime/size."""
+    def __init__(self, journal_dir=JOURNAL_DIR, cache_file=ANALYTICS_CACHE_FILE):
+        self.journal_dir = journal_dir
+        self.cache_file = cache_file
+        self.days = {}  # {date_iso_str: {"mtime": ..., "size": ..., "analysis": {...}}}
+        # refresh() runs from concurrent request threads; guards self.days and the cache file
+        self._lock = threading.RLock()
+        self._load_cache()
+
+    def _load_cache(self):
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.days = data.get("days", {})
+        except (json.JSONDecodeError, IOError, AttributeError) as e:
+            print(f"Error loading journal analytics cache: {e}. Rebuilding.")
+            self.days = {}
+
+    def _save_cache(self):
+        # Unique temp name as well, in case another JournalAnalytics shares the cache file
+        tmp_path = f"{self.cache_file}.{uuid.uuid4().hex}.tmp"
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump({"version": CACHE_VERSION, "days": self.days}, f)
+            os.replace(tmp_path, self.cache_file)
+
+    def refresh(self):
+        """Re-analyzes only new or changed day files. Returns the number of days processed."""
+        with self._lock:
+            if not os.path.exists(self.journal_dir):
+                return 0
+            seen = set()
+            processed = 0
+            with os.scandir(self.journal_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".txt"):
+                        continue
+                    date_str = entry.name[:-4]
+                    try:
+                        datetime.strptime(date_str, "%Y-%m-%d")
+                    except ValueError:
+                        continue  # Same rule as read_journal_entries
+                    seen.add(date_str)
+                    stat = entry.stat()
+                    cached = self.days.get(date_str)
+                    if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+                        continue
+                    self.days[date_str] = {
+                        "mtime": stat.st_mtime,
+                        "size": stat.st_size,
+                        "analysis": analyze_day_file(entry.path),
+                    }
+                    processed += 1
+
+            removed = [d for d in self.days if d not in seen]
+            for date_str in removed:
+                del self.days[date_str]
+            if processed or removed:
+                self._save_cache()
+            return processed
+
+    def get_day(self, date_str):
+        with self._lock:
+            cached = self.days.get(date_str)
+        return cached["analysis"] if cached else None
+
+    def get_monthly_mood_trend(self, year, month):
+        """Mood summary for a month, shaped to sit next to MonthlyReport.get_report_data()."""
+        prefix = f"{year:04d}-{month:02d}-"
+        daily = []
+        moods = Counter()
+        keywords = Counter()
+        with self._lock:
+            month_days = sorted((d, c["analysis"]) for d, c in self.days.items() if d.startswith(prefix))
+        for date_str, analysis in month_days:
+            moods.update(analysis["moods"])
+            keywords.update(analysis["keywords"])
+            daily.append({
+                "date": date_str,
+                "mood_score": analysis["mood_score"],
+                "moods": analysis["moods"],
+            })
+
+        scored = [d["mood_score"] for d in daily if d["moods"]]
+        return {
+            "month_year": f"{calendar.month_name[month]} {year}",
+            "journal_days": len(daily),
+            "average_mood_score": round(sum(scored) / len(scored), 4) if scored else 0.0,
+            "dominant_mood": moods.most_common(1)[0][0] if moods else None,
+            "mood_counts": dict(moods),
+            "top_keywords": [word for word, _ in keywords.most_common(TOP_KEYWORDS)],
+            "daily_moods": daily,
+        }
+
+    def get_monthly_mood_trends(self):
+        """Mood summaries for every month that has journal entries, oldest first."""
+        with self._lock:
+            months = sorted({(int(d[:4]), int(d[5:7])) for d in self.days})
+        return [self.get_monthly_mood_trend(year, month) for year, month in months]
+
+
+# Initialise a global analytics instance for the app to use
+journal_analytics = JournalAnalytics()
+
+if __name__ == "__main__":
+    processed = journal_analytics.refresh()
+    print(f"Analyzed {processed} new or changed journal day(s).")
+    for trend in journal_analytics.get_monthly_mood_trends():
+        print(f"{trend['month_year']}: {trend['journal_days']} day(s), "
+              f"average mood {trend['average_mood_score']:+.2f}, dominant mood: {trend['dominant_mood']}")
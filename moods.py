@@ -0,0 +1,20 @@
+# moods.py
+# Mood vocabulary shared by the all4 chatbot and journal_analytics
+
+# Mood keywords recognised by the chatbot, with its reply for each
+MOOD_RESPONSES = {
+    "sad": "I'm sorry you're feeling that way. Sometimes journaling helps you reflect and feel lighter.",
+    "anxious": "That’s okay. Take a deep breath. Would you like a grounding tip?",
+    "stress": "Stress can be overwhelming. Try closing your eyes and taking 3 deep breaths.",
+    "happy": "That’s great to hear! What made you happy today?",
+    "motivate": "Remember, progress is progress — even small steps count!"
+}
+
+# Word forms counted as each mood (explicit, so 'saddle' is not 'sad')
+MOOD_INFLECTIONS = {
+    "sad": ("sad", "sadder", "saddest", "sadly", "sadness", "saddened"),
+    "anxious": ("anxious", "anxiously", "anxiety", "anxieties"),
+    "stress": ("stress", "stressed", "stresses", "stressing", "stressful"),
+    "happy": ("happy", "happier", "happiest", "happily", "happiness"),
+    "motivate": ("motivate", "motivated", "motivates", "motivating", "motivation", "motivational"),
+}
@@ -0,0 +1,271 @@
+# reminders.py
+import datetime
+import heapq
+import itertools
+import logging
+import queue
+import re
+import threading
+
+logger = logging.getLogger("lifesync.reminders")
+
+DEFAULT_USER = "default"
+COMPACT_RATIO = 0.5  # Rebuild the heap once more than this share of its entries are stale
+# Reminders this far past due are dropped by queries; comfortably longer than the scheduler's
+# max_sleep, so a running scheduler has dispatched them first
+MISSED_GRACE = datetime.timedelta(minutes=5)
+
+_TIME_RE = re.compile(r"^\s*(\d{1,2})(?:[:.](\d{2}))?(?::(\d{2}))?\s*([ap]\.?m\.?)?\s*$", re.IGNORECASE)
+
+
+def parse_routine_time(text):
+    """Normalizes a free-form RoutineItem.time ("05:30", "7:00 AM", "7pm") to a datetime.time.
+
+    Returns None for empty or unrecognised values.
+    """
+    if not text:
+        return None
+    match = _TIME_RE.match(text)
+    if not match:
+        return None
+    hour, minute, second, meridiem = match.groups()
+    hour, minute, second = int(hour), int(minute or 0), int(second or 0)
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem[0].lower() == "p" else 0)
+    elif match.group(2) is None:
+        return None  # A bare number like "7" is too ambiguous to schedule
+    try:
+        return datetime.time(hour, minute, second)
+    except ValueError:
+        return None
+
+
+class Reminder:
+    """A routine item that is due at a given moment."""
+    def __init__(self, user, date, task, time, due):
+        self.user = user
+        self.date = date
+        self.task = task
+        self.time = time  # Original RoutineItem.time string
+        self.due = due
+
+    def __repr__(self):
+        return f"Reminder(user='{self.user}', task='{self.task}', due={self.due.isoformat()})"
+
+    def to_dict(self):
+        return {"user": self.user, "date": self.date.isoformat(), "task": self.task,
+                "time": self.time, "due": self.due.isoformat()}
+
+
+class ReminderIndex:
+    """Min-heap of upcoming reminders across days and users, updated incrementally.
+
+    Removed entries are marked stale and skipped (lazy deletion) so every update is O(log n).
+    """
+    def __init__(self, clock=datetime.datetime.now):
+        self.clock = clock
+        self.changed = threading.Condition()  # Also guards the heap; notified on every insert
+        self._heap = []  # [due, seq, key, reminder]; reminder is None once stale
+        self._entries = {}  # {key: heap entry}
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --- Updates ---
+    def add(self, key, reminder):
+        """Indexes a reminder, replacing any existing one with the same key. Past items are ignored."""
+        with self.changed:
+            self._discard(key)
+            if reminder.due < self.clock():
+                return False
+            entry = [reminder.due, next(self._seq), key, reminder]
+            self._entries[key] = entry
+            heapq.heappush(self._heap, entry)
+            self.changed.notify_all()
+            return True
+
+    def remove(self, key):
+        with self.changed:
+            self._discard(key)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        entry[-1] = None
+        if len(self._heap) > 16 and len(self._entries) < len(self._heap) * COMPACT_RATIO:
+            self._heap = [e for e in self._heap if e[-1] is not None]
+            heapq.heapify(self._heap)
+
+    # --- Queries ---
+    def next_due(self):
+        """Due time of the earliest live reminder, or None."""
+        with self.changed:
+            while self._heap and self._heap[0][-1] is None:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def due_within(self, minutes, now=None):
+        """Reminders due in the next `minutes`, soonest first, without removing them.
+
+        Walks only the heap nodes inside the window: O(k log k) for k matches (plus stale
+        entries), independent of how many reminders are indexed further out. Reminders more
+        than MISSED_GRACE past due are dropped first, so they never accumulate at the top.
+        """
+        now = now or self.clock()
+        until = now + datetime.timedelta(minutes=minutes)
+        found = []
+        with self.changed:
+            self._prune_missed(now - MISSED_GRACE)
+            heap = self._heap
+            frontier = [(heap[0][0], heap[0][1], 0)] if heap else []
+            while frontier:
+                due, _, i = heapq.heappop(frontier)
+                if due > until:
+                    break
+                reminder = heap[i][-1]
+                if reminder is not None and due >= now:
+                    found.append(reminder)
+                for child in (2 * i + 1, 2 * i + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, (heap[child][0], heap[child][1], child))
+        return found
+
+    def _prune_missed(self, before):
+        # Keeps queries from walking reminders that no scheduler is going to pop
+        while self._heap and self._heap[0][0] < before:
+            entry = heapq.heappop(self._heap)
+            if entry[-1] is not None:
+                del self._entries[entry[2]]
+                logger.debug("Dropping missed reminder %r", entry[-1])
+
+    def pop_due(self, now=None):
+        """Removes and returns every reminder due at or before now."""
+        now = now or self.clock()
+        due = []
+        with self.changed:
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if entry[-1] is not None:
+                    del self._entries[entry[2]]
+                    due.append(entry[-1])
+        return due
+
+    # --- Routine tracking ---
+    def watch(self, routines_store, user=DEFAULT_USER):
+        """Indexes a RoutineStore's routines and follows its future changes for `user`."""
+        listener = _RoutineListener(self, user)
+        for routine in routines_store.values():
+            listener.routine_added(routine)
+        routines_store.add_listener(listener)
+        return listener
+
+
+class _RoutineListener:
+    """RoutineStore listener that keeps one user's routine items in a ReminderIndex."""
+    def __init__(self, index, user):
+        self.index = index
+        self.user = user
+
+    def _key(self, routine, item):
+        # Keyed by item identity: tasks are only unique per day by convention
+        return (self.user, routine.date.isoformat(), id(item))
+
+    def _index_item(self, routine, item):
+        key = self._key(routine, item)
+        time_of_day = parse_routine_time(item.time)
+        if item.completed or time_of_day is None:
+            self.index.remove(key)
+            return
+        due = datetime.datetime.combine(routine.date, time_of_day)
+        self.index.add(key, Reminder(self.user, routine.date, item.task, item.time, due))
+
+    def routine_added(self, routine):
+        for item in routine.items:
+            self._index_item(routine, item)
+
+    def routine_removed(self, routine):
+        for item in routine.items:
+            self.index.remove(self._key(routine, item))
+
+    def item_added(self, routine, item):
+        self._index_item(routine, item)
+
+    def item_toggled(self, routine, item):
+        self._index_item(routine, item)
+
+    def item_removed(self, routine, item):
+        self.index.remove(self._key(routine, item))
+
+
+# --- Sinks ---
+class LogReminderSink:
+    """Writes due reminders to the log."""
+    def __init__(self, log=logger, level=logging.INFO):
+        self.log = log
+        self.level = level
+        # Loggers inherit the root's WARNING by default, which would silently drop every reminder
+        if log.getEffectiveLevel() > level:
+            log.setLevel(level)
+
+    def send(self, reminder):
+        self.log.log(self.level, "Reminder for %s: '%s' is due at %s",
+                     reminder.user, reminder.task, reminder.due)
+
+
+class QueueReminderSink:
+    """Puts due reminders on a queue.Queue for another component (or a test) to consume."""
+    def __init__(self, reminders_queue=None):
+        self.queue = reminders_queue if reminders_queue is not None else queue.Queue()
+
+    def send(self, reminder):
+        self.queue.put(reminder)
+
+
+class ReminderScheduler:
+    """Background thread that sleeps until the next reminder is due and hands it to a sink."""
+    def __init__(self, index, sink, max_sleep=60.0):
+        self.index = index
+        self.sink = sink
+        self.max_sleep = max_sleep  # Upper bound so clock changes are noticed
+        self._stopping = False
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="reminder-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        with self.index.changed:
+            self._stopping = True
+            self.index.changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            for reminder in self.index.pop_due():
+                try:
+                    self.sink.send(reminder)
+                except Exception:
+                    logger.exception("Reminder sink failed for %r", reminder)
+            with self.index.changed:
+                if self._stopping:
+                    return
+                next_due = self.index.next_due()
+                wait = self.max_sleep
+                if next_due is not None:
+                    wait = min(wait, max((next_due - self.index.clock()).total_seconds(), 0))
+                if wait > 0:
+                    self.index.changed.wait(wait)
@@ -0,0 +1,104 @@
+import datetime
+import json
+
+import dailytracker
+from dailytracker import (
+    DailyRoutine,
+    RoutineItem,
+    RoutineStore,
+    MonthlyReport,
+    check_rollups,
+    get_or_create_routine,
+    load_routines,
+    save_routines,
+)
+
+
+def make_store():
+    store = RoutineStore()
+    start = datetime.date(2025, 5, 1)
+    for offset in range(10):
+        routine = get_or_create_routine(start + datetime.timedelta(days=offset), store)
+        for task in ("Wake up", "Exercise", "Read"):
+            routine.add_item(RoutineItem(task, completed=offset % 2 == 0))
+    return store
+
+
+def test_rollups_stay_consistent_after_add_toggle_remove():
+    store = make_store()
+    store["2025-05-02"].mark_item_complete("Exercise")
+    store["2025-05-03"].mark_item_complete("Read", False)
+    store["2025-05-04"].remove_item("Wake up")
+    store["2025-05-05"].add_item(RoutineItem("Meditate", completed=True))
+    del store["2025-05-06"]
+    get_or_create_routine(datetime.date(2025, 6, 1), store).add_item(RoutineItem("Walk"))
+
+    assert check_rollups(store) == []
+
+
+def test_rollups_follow_every_dict_mutator():
+    store = make_store()
+    removed = store.pop("2025-05-01")
+    assert store.pop("2030-01-01", None) is None
+    store.popitem()
+    store.update({"2025-06-01": DailyRoutine(datetime.date(2025, 6, 1))})
+    store["2025-06-01"].add_item(RoutineItem("Walk", completed=True))
+    replacement = DailyRoutine(datetime.date(2025, 5, 2))
+    replacement.add_item(RoutineItem("Swim"))
+    store |= {"2025-05-02": replacement}
+    store.setdefault("2025-05-03", None)  # Existing key: left as is
+    assert check_rollups(store) == []
+
+    store.clear()
+    assert check_rollups(store) == []
+    assert store.rollups.get_month(2025, 5)["recorded_days"] == 0
+
+
+def test_monthly_report_matches_raw_data():
+    store = make_store()
+    store["2025-05-02"].mark_item_complete("Exercise")
+
+    from_rollups = MonthlyReport(2025, 5, store)
+    from_raw = MonthlyReport(2025, 5, dict(store))
+    assert from_rollups.get_completed_days() == from_raw.get_completed_days()
+    assert abs(from_rollups.get_average_completion() - from_raw.get_average_completion()) < 1e-9
+
+
+def test_current_streak():
+    store = make_store()
+    # Even days (offsets 0, 2, ...) are fully completed; complete 2025-05-10 (offset 9) as well
+    for task in ("Wake up", "Exercise", "Read"):
+        store["2025-05-10"].mark_item_complete(task)
+    assert store.rollups.get_current_streak(datetime.date(2025, 5, 10)) == 2
+
+
+def test_load_rebuilds_stale_rollups(tmp_path, monkeypatch):
+    monkeypatch.setattr(dailytracker, "ROUTINES_FILE", str(tmp_path / "routines.json"))
+    save_routines(make_store())
+
+    # Edit the routine data behind the rollups' back
+    with open(dailytracker.ROUTINES_FILE) as f:
+        data = json.load(f)
+    data["2025-05-02"]["items"][0]["completed"] = True
+    with open(dailytracker.ROUTINES_FILE, "w") as f:
+        json.dump(data, f)
+
+    store = load_routines()
+    assert check_rollups(store) == []
+    assert MonthlyReport(2025, 5, store).get_completed_days() == MonthlyReport(2025, 5, dict(store)).get_completed_days()
+
+
+def test_load_rebuilds_corrupted_aggregates(tmp_path, monkeypatch):
+    monkeypatch.setattr(dailytracker, "ROUTINES_FILE", str(tmp_path / "routines.json"))
+    save_routines(make_store())
+
+    # Days still match the routines, only a month aggregate is wrong
+    with open(dailytracker.ROUTINES_FILE) as f:
+        data = json.load(f)
+    data["_rollups"]["months"]["2025-05"]["fully_completed_days"] = 7
+    with open(dailytracker.ROUTINES_FILE, "w") as f:
+        json.dump(data, f)
+
+    store = load_routines()
+    assert check_rollups(store) == []
+    assert MonthlyReport(2025, 5, store).get_completed_days() == 5
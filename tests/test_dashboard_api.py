@@ -0,0 +1,89 @@
+import datetime
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+
+import app as lifesync_app
+from dailytracker import RoutineItem, RoutineStore, get_or_create_routine
+
+
+@pytest.fixture
+def client(monkeypatch):
+    store = RoutineStore()
+    routine = get_or_create_routine(datetime.date.today(), store)
+    routine.add_item(RoutineItem("Stretch", completed=True))
+    monkeypatch.setattr(lifesync_app, "all_routines_data", store)
+    monkeypatch.setattr(lifesync_app, "_dashboard_journal", lambda: {"entries": []})
+    return lifesync_app.app.test_client()
+
+
+def get_sections(client):
+    response = client.get("/api/dashboard")
+    assert response.status_code == 200
+    return response.get_json()["sections"]
+
+
+def assert_ok(section):
+    assert section["status"] == "ok"
+    assert isinstance(section["elapsed_ms"], float)
+
+
+def test_all_sections_ok(client):
+    sections = get_sections(client)
+    for name in ("routine", "streak", "journal", "attractions"):
+        assert_ok(sections[name])
+    assert sections["routine"]["data"]["completion"] == 100.0
+    assert sections["streak"]["data"]["current_streak"] == 1
+
+
+def test_slow_section_times_out_without_holding_back_the_rest(client, monkeypatch):
+    release = threading.Event()
+
+    def stuck_journal():
+        release.wait(5)
+        return {"entries": []}
+
+    monkeypatch.setattr(lifesync_app, "_dashboard_journal", stuck_journal)
+    monkeypatch.setitem(lifesync_app.DASHBOARD_SECTION_TIMEOUTS, "journal", 0.05)
+    try:
+        started = time.perf_counter()
+        sections = get_sections(client)
+        assert time.perf_counter() - started < 2
+    finally:
+        release.set()
+
+    assert sections["journal"] == {"status": "timeout", "data": None, "elapsed_ms": None}
+    for name in ("routine", "streak", "attractions"):
+        assert_ok(sections[name])
+
+
+def test_failing_section_reports_error(client, monkeypatch):
+    def broken_attractions(latitude, longitude):
+        raise RuntimeError("map service down")
+
+    monkeypatch.setattr(lifesync_app, "_dashboard_attractions", broken_attractions)
+    sections = get_sections(client)
+
+    assert sections["attractions"]["status"] == "error"
+    assert "map service down" in sections["attractions"]["error"]
+    for name in ("routine", "streak", "journal"):
+        assert_ok(sections[name])
+
+
+def test_section_with_all_slots_taken_reports_busy(client):
+    slots = lifesync_app.dashboard_slots["journal"]
+    taken = 0
+    while slots.acquire(blocking=False):
+        taken += 1
+    try:
+        sections = get_sections(client)
+    finally:
+        for _ in range(taken):
+            slots.release()
+
+    assert sections["journal"]["status"] == "busy"
+    for name in ("routine", "streak", "attractions"):
+        assert_ok(sections[name])
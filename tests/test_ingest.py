@@ -0,0 +1,123 @@
+import json
+import os
+
+import all4
+
+
+def test_normalize_record_rejects_unsafe_usernames():
+    for user in ("../escape", "a/b", "a\\b", ".hidden", "..", ""):
+        assert all4._normalize_record({"user": user, "type": "journal", "date": "2026-10-01", "entry": "x"}) is None
+
+
+def test_normalize_record_normalizes_dates_and_types():
+    record = all4._normalize_record({"user": "Sam", "type": "journal", "date": "2026-10-02", "entry": 42})
+    assert record == {"user": "sam", "type": "journal", "date": "2026-10-02", "entry": "42"}
+    # Routine and journal records need a date; health records do not
+    assert all4._normalize_record({"user": "sam", "type": "routine", "steps_walked": 10}) is None
+    assert all4._normalize_record({"user": "sam", "type": "health", "past_issues": "asthma"})["past_issues"] == "asthma"
+
+
+def test_read_chunks_skips_bad_lines(tmp_path):
+    path = tmp_path / "records.ndjson"
+    good = json.dumps({"user": "sam", "type": "journal", "date": "2026-10-01", "entry": "hi"}).encode()
+    path.write_bytes(good + b"\n\xff\xfe not utf-8\n{broken json\n" + good + b"\n")
+
+    chunks = list(all4._read_chunks(str(path), 0, 100))
+    assert len(chunks) == 1
+    records, end_offset, skipped = chunks[0]
+    assert len(records) == 2 and skipped == 2
+    assert end_offset == os.path.getsize(path)
+
+
+def test_ingest_user_writes_inside_user_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(all4, "DATA_DIR", str(tmp_path))
+    records = [
+        {"user": "sam", "type": "routine", "date": "2026-10-01", "steps_walked": "100"},
+        {"user": "sam", "type": "routine", "date": "2026-10-01", "steps_walked": "200"},
+        {"user": "sam", "type": "journal", "date": "2026-10-01", "entry": "hello"},
+    ]
+    assert all4._ingest_user(("sam", records)) == 3
+    with open(tmp_path / "sam" / "routine.json") as f:
+        assert json.load(f) == {"2026-10-01": {"date": "2026-10-01", "steps_walked": "200"}}
+    assert (tmp_path / "sam" / "journal_2026-10-01.txt").read_text() == "hello"
+
+
+def test_read_chunks_keeps_multiline_csv_fields(tmp_path):
+    path = tmp_path / "records.csv"
+    path.write_bytes(
+        b"user,type,date,entry\n"
+        b'sam,journal,2026-02-02,"line one\nline two, with ""quotes"""\n'
+        b"sam,journal,2026-02-03,single line\n"
+    )
+
+    chunks = list(all4._read_chunks(str(path), 0, 1))
+    assert [c[0][0]["entry"] for c in chunks] == ['line one\nline two, with "quotes"', "single line"]
+    assert all(skipped == 0 for _, _, skipped in chunks)
+    # The first checkpoint offset falls after the whole multi-line row
+    assert chunks[0][1] == len(b"user,type,date,entry\n") + len(b'sam,journal,2026-02-02,"line one\nline two, with ""quotes"""\n')
+
+
+def test_read_chunks_rejects_unterminated_csv_quote(tmp_path):
+    path = tmp_path / "records.csv"
+    path.write_bytes(b'user,type,date,entry\nsam,journal,2026-02-02,"never closed\nmore\n')
+
+    (records, _, skipped), = all4._read_chunks(str(path), 0, 10)
+    assert records == [] and skipped == 1
+
+
+def routine_records(start, count):
+    return "".join(
+        json.dumps({"user": f"user{i % 3}", "type": "routine", "date": f"2026-03-{i % 28 + 1:02d}",
+                    "steps_walked": str(i)}) + "\n"
+        for i in range(start, start + count)
+    )
+
+
+def snapshot(data_dir):
+    files = {}
+    for root, _, names in os.walk(data_dir):
+        for name in names:
+            if name != os.path.basename(all4.INGEST_CHECKPOINT):
+                with open(os.path.join(root, name), encoding="utf-8") as f:
+                    files[os.path.relpath(os.path.join(root, name), data_dir)] = f.read()
+    return files
+
+
+def test_ingest_resumes_from_rewound_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # DATA_DIR and the checkpoint are relative paths
+    source = tmp_path / "records.ndjson"
+    source.write_text(routine_records(0, 60))
+
+    assert all4.ingest(str(source), workers=2, chunk_size=10) == 60
+    completed = snapshot(all4.DATA_DIR)
+
+    # Pretend the import died after its second chunk and run it again
+    offsets = [end for _, end, _ in all4._read_chunks(str(source), 0, 10)]
+    with open(all4.INGEST_CHECKPOINT) as f:
+        checkpoint = json.load(f)
+    checkpoint[str(source)]["offset"] = offsets[1]
+    with open(all4.INGEST_CHECKPOINT, "w") as f:
+        json.dump(checkpoint, f)
+
+    assert all4.ingest(str(source), workers=2, chunk_size=10) == 40
+    assert snapshot(all4.DATA_DIR) == completed
+    assert all4.ingest(str(source), workers=2, chunk_size=10) == 0
+
+
+def test_ingest_continues_grown_file_from_saved_offset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "records.ndjson"
+    source.write_text(routine_records(0, 30))
+    assert all4.ingest(str(source), workers=2, chunk_size=10) == 30
+
+    with open(source, "a") as f:
+        f.write(routine_records(30, 5))
+    assert all4.ingest(str(source), workers=2, chunk_size=10) == 5
+
+    # Same result as importing the whole file in one go
+    grown = snapshot(all4.DATA_DIR)
+    fresh = tmp_path / "fresh"
+    fresh.mkdir()
+    monkeypatch.chdir(fresh)
+    all4.ingest(str(source), workers=2, chunk_size=100)
+    assert snapshot(all4.DATA_DIR) == grown
@@ -0,0 +1,60 @@
+import os
+
+from journal_analytics import JournalAnalytics, score_text
+
+
+def write_day(journal_dir, date_str, text, mode="w"):
+    with open(journal_dir / f"{date_str}.txt", mode, encoding="utf-8") as f:
+        f.write(text)
+
+
+def make_analytics(tmp_path):
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    write_day(journal_dir, "2025-05-01", "2025-05-01 08:00:00\nI'm happy about the garden\n\n")
+    write_day(journal_dir, "2025-05-02", "2025-05-02 08:00:00\nStressed about work\n\n")
+    write_day(journal_dir, "2025-05-03", "2025-05-03 08:00:00\nQuiet garden walk\n\n")
+    cache_file = str(tmp_path / "cache.json")
+    return journal_dir, cache_file, JournalAnalytics(str(journal_dir), cache_file)
+
+
+def test_unchanged_refresh_does_no_work(tmp_path):
+    journal_dir, cache_file, analytics = make_analytics(tmp_path)
+    assert analytics.refresh() == 3
+    assert analytics.refresh() == 0
+    # A fresh instance picks the results up from the cache file
+    assert JournalAnalytics(str(journal_dir), cache_file).refresh() == 0
+
+
+def test_only_changed_day_is_reprocessed(tmp_path):
+    journal_dir, cache_file, analytics = make_analytics(tmp_path)
+    analytics.refresh()
+    write_day(journal_dir, "2025-05-02", "2025-05-02 20:00:00\nHappy again\n\n", mode="a")
+
+    assert analytics.refresh() == 1
+    assert [e["timestamp"] for e in analytics.get_day("2025-05-02")["entries"]] == [
+        "2025-05-02 08:00:00", "2025-05-02 20:00:00"]
+    assert analytics.get_monthly_mood_trend(2025, 5)["mood_counts"] == {"happy": 2, "stress": 1}
+
+
+def test_deleted_day_is_dropped_from_cache(tmp_path):
+    journal_dir, cache_file, analytics = make_analytics(tmp_path)
+    analytics.refresh()
+    os.remove(journal_dir / "2025-05-03.txt")
+
+    assert analytics.refresh() == 0
+    assert analytics.get_day("2025-05-03") is None
+    assert JournalAnalytics(str(journal_dir), cache_file).get_day("2025-05-03") is None
+    assert analytics.get_monthly_mood_trend(2025, 5)["journal_days"] == 2
+
+
+def test_monthly_keywords_use_full_day_counts(tmp_path):
+    journal_dir, cache_file, analytics = make_analytics(tmp_path)
+    analytics.refresh()
+    assert analytics.get_monthly_mood_trend(2025, 5)["top_keywords"][0] == "garden"
+    assert "i'm" not in analytics.get_monthly_mood_trend(2025, 5)["top_keywords"]
+
+
+def test_score_text_matches_whole_mood_words():
+    assert score_text("saddle sadistic")["moods"] == {}
+    assert score_text("Happy saddle day, stressed and saddened")["moods"] == {"happy": 1, "stress": 1, "sad": 1}
@@ -0,0 +1,101 @@
+import datetime
+import logging
+
+import pytest
+
+from dailytracker import RoutineItem, RoutineStore, get_or_create_routine
+from reminders import (
+    LogReminderSink,
+    QueueReminderSink,
+    Reminder,
+    ReminderIndex,
+    ReminderScheduler,
+    parse_routine_time,
+)
+
+NOW = datetime.datetime(2025, 5, 11, 6, 0)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("05:30", datetime.time(5, 30)),
+    ("7:00 AM", datetime.time(7, 0)),
+    ("7pm", datetime.time(19, 0)),
+    ("12 AM", datetime.time(0, 0)),
+    ("12:15 pm", datetime.time(12, 15)),
+    ("19:00:00", datetime.time(19, 0)),
+    ("7.45am", datetime.time(7, 45)),
+    ("7", None),
+    ("25:00", None),
+    ("13 PM", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_routine_time(text, expected):
+    assert parse_routine_time(text) == expected
+
+
+def test_due_within_follows_routine_changes():
+    store = RoutineStore()
+    index = ReminderIndex(clock=lambda: NOW)
+    index.watch(store)
+    routine = get_or_create_routine(NOW.date(), store)
+    routine.add_item(RoutineItem("Stretch", time="06:10"))
+    routine.add_item(RoutineItem("Exercise", time="6:30 AM"))
+    routine.add_item(RoutineItem("Breakfast", time="08:00"))
+    routine.add_item(RoutineItem("Untimed"))
+
+    assert [r.task for r in index.due_within(60)] == ["Stretch", "Exercise"]
+
+    routine.mark_item_complete("Stretch")
+    assert [r.task for r in index.due_within(60)] == ["Exercise"]
+
+    routine.mark_item_complete("Stretch", False)
+    routine.remove_item("Exercise")
+    assert [r.task for r in index.due_within(60)] == ["Stretch"]
+    assert [r.task for r in index.due_within(180)] == ["Stretch", "Breakfast"]
+
+
+def test_due_within_drops_long_missed_reminders():
+    clock = [NOW]
+    index = ReminderIndex(clock=lambda: clock[0])
+    for minute in range(50):
+        due = NOW + datetime.timedelta(minutes=minute)
+        index.add(minute, Reminder("u", NOW.date(), f"task {minute}", "", due))
+
+    clock[0] = NOW + datetime.timedelta(hours=2)
+    assert index.due_within(60) == []
+    assert len(index) == 0
+
+
+def test_scheduler_delivers_to_queue_sink():
+    index = ReminderIndex()
+    due = datetime.datetime.now() + datetime.timedelta(milliseconds=200)
+    index.add("key", Reminder("u", due.date(), "Drink water", "", due))
+    sink = QueueReminderSink()
+    scheduler = ReminderScheduler(index, sink).start()
+    try:
+        reminder = sink.queue.get(timeout=5)
+    finally:
+        scheduler.stop(timeout=5)
+    assert reminder.task == "Drink water"
+    assert len(index) == 0
+
+
+def test_log_sink_emits_under_default_warning_level(caplog, monkeypatch):
+    # Root at WARNING, as outside Flask's debug mode; the test logger inherits it
+    monkeypatch.setattr(logging.getLogger(), "level", logging.WARNING)
+    log = logging.getLogger("lifesync.tests.reminders")
+    assert not log.isEnabledFor(logging.INFO)
+
+    LogReminderSink(log).send(Reminder("u", NOW.date(), "Drink water", "", NOW))
+    assert any("Drink water" in record.getMessage() for record in caplog.records)
+
+
+def test_reminder_index_follows_store_pop():
+    store = RoutineStore()
+    index = ReminderIndex(clock=lambda: NOW)
+    index.watch(store)
+    get_or_create_routine(NOW.date(), store).add_item(RoutineItem("Stretch", time="06:10"))
+
+    store.pop(NOW.date().isoformat())
+    assert index.due_within(60) == []